@@ -0,0 +1,36 @@
+"""Add project asset lookup index
+
+Revision ID: 4c8e2f1a9d37
+Revises: b9e1a8e285ba
+Create Date: 2026-10-15 20:12:41.318204
+
+"""
+import sqlalchemy as sa
+
+# pylint: disable=no-member, invalid-name
+from alembic import op
+
+# Elasticsearch operators such as es.create_index, es.remove_index, es.update_index_mapping, es.bulk_load_index_from_jsonl, etc
+from migrations import es
+
+# revision identifiers, used by Alembic.
+revision = "4c8e2f1a9d37"
+down_revision = "b9e1a8e285ba"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_project_asset_project_id_resource_type_resource_id",
+        "project_asset",
+        ["project_id", "resource_type", "resource_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_project_asset_project_id_resource_type_resource_id",
+        table_name="project_asset",
+    )
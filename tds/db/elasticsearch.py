@@ -2,6 +2,7 @@
 The configured ElasticSearch DB engine
 """
 import logging
+from functools import lru_cache
 
 from elasticsearch import Elasticsearch
 
@@ -10,13 +11,26 @@ from tds.settings import settings
 logger = logging.Logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def cached_es_client(url: str, username: str, password: str) -> Elasticsearch:
+    """
+    Builds one client per configured cluster. The client is thread safe and
+    keeps a pool of HTTP connections that is reused across requests.
+    """
+    return Elasticsearch(
+        [url],
+        basic_auth=(username, password),
+        connections_per_node=settings.ES_CONNECTIONS_PER_NODE,
+    )
+
+
 def es_client():
     """
     Factory Function that provides an ElasticSearch connection.
     """
     if settings.ES_URL:
-        return Elasticsearch(
-            [settings.ES_URL], basic_auth=(settings.ES_USERNAME, settings.ES_PASSWORD)
+        return cached_es_client(
+            settings.ES_URL, settings.ES_USERNAME, settings.ES_PASSWORD
         )
     else:
         return None
@@ -2,17 +2,77 @@
 Handler for object relations
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import HTTPException
 from neo4j import Driver
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Session
 
+from tds.db.enums import ProvenanceType, RelationType
+from tds.db.graph.query_helpers import cypher_label
 from tds.modules.provenance.model import Provenance, ProvenancePayload
 from tds.modules.provenance.utils import validate_relationship
 
 
+def provenance_by_id(provenance_id: int):
+    """
+    Select a provenance record by id. Built as a lambda statement so the query
+    is constructed and compiled once and then reused with a new bound id.
+    """
+    return lambda_stmt(lambda: select(Provenance).where(Provenance.id == provenance_id))
+
+
+@lru_cache(maxsize=None)
+def merge_relationship_query(
+    left_type: ProvenanceType,
+    right_type: ProvenanceType,
+    relation_type: RelationType,
+    with_user_id: bool,
+) -> str:
+    """
+    Cypher that creates both nodes if they don't exist yet and draws the edge
+    between them in a single statement. Cached per label combination so every
+    write of the same kind reuses the exact same query text.
+    """
+    left_label = cypher_label(ProvenanceType, left_type)
+    right_label = cypher_label(ProvenanceType, right_type)
+    relation_label = cypher_label(RelationType, relation_type)
+    edge_properties = " {user_id: $user_id}" if with_user_id else ""
+    return (
+        f"MERGE (n1:{left_label} {{id: $left_id, concept: $concept}}) "
+        + f"MERGE (n2:{right_label} {{id: $right_id, concept: '.'}}) "
+        + f"MERGE (n1)-[:{relation_label}{edge_properties}]->(n2)"
+    )
+
+
+@lru_cache(maxsize=None)
+def delete_relationship_query(
+    left_type: ProvenanceType,
+    right_type: ProvenanceType,
+    relation_type: RelationType,
+) -> str:
+    """
+    Cypher that deletes the edge between two nodes, cached per label combination.
+    """
+    left_label = cypher_label(ProvenanceType, left_type)
+    right_label = cypher_label(ProvenanceType, right_type)
+    relation_label = cypher_label(RelationType, relation_type)
+    return (
+        f"Match (n1: {left_label} ) "
+        + "Where n1.id = $left "
+        + f"Match (n2: {right_label} ) "
+        + "Where n2.id = $right "
+        + "Match (n1)-[r:"
+        + relation_label
+        # + " {user_id : $user_id}"
+        + "]->(n2)"
+        + "Delete r"
+    )
+
+
 class ProvenanceHandler:
     """
     The handler wraps crud operations and writes to
@@ -20,7 +80,7 @@ class ProvenanceHandler:
     """
 
     def __init__(self, rdb: Engine, graph_db: Optional[Driver] = None):
-        self.__connection__ = rdb.connect()
+        self.rdb = rdb
         self.graph_db = graph_db
 
     def cache_enabled(self):
@@ -42,11 +102,14 @@ class ProvenanceHandler:
         ):
             raise HTTPException(status_code=400, detail="Relationship not supported")
 
-        with Session(self.__connection__) as session:
+        with Session(self.rdb) as session:
             provenance = Provenance(**entry_dict)
             session.add(provenance)
-            session.commit()
+            # Read the id after the flush, the commit would expire it and cost
+            # a refresh SELECT.
+            session.flush()
             provenance_id: int = provenance.id
+            session.commit()
 
         if self.cache_enabled():
             self.create_node_relationship(entry_dict)
@@ -73,101 +136,73 @@ class ProvenanceHandler:
     #         return id
     #     raise Exception("Invalid object in relation")
 
-    # def retrieve(self, id: int) -> Optional[Provenance]:
-    #     """
-    #     Retrieves a relation between two resources
-    #     """
-    #     with Session(self.__connection__) as session:
-    #         if (
-    #             session.query(orm.Provenance).filter(orm.Provenance.id == id).count()
-    #             == 1
-    #         ):
-    #             provenance = session.query(orm.Provenance).get(id)
-    #             return Provenance.from_orm(provenance)
-    #         return None
+    def retrieve(self, id: int) -> Optional[Provenance]:
+        """
+        Retrieves a relation between two resources
+        """
+        with Session(self.rdb) as session:
+            return session.execute(provenance_by_id(id)).scalar_one_or_none()
 
     def delete(self, id: int) -> bool:
         """
         Deletes the edge between two resources (not the nodes)
         """
-        with Session(self.__connection__) as session:
-            if session.query(Provenance).filter(Provenance.id == id).count() == 1:
-                provenance = session.query(Provenance).get(id)
-                session.delete(provenance)
-                session.commit()
-                provenance_dict = provenance.__dict__
-
-                if self.cache_enabled():
-                    self.delete_node_relationship(provenance_payload=provenance_dict)
+        with Session(self.rdb) as session:
+            provenance = session.execute(provenance_by_id(id)).scalar_one_or_none()
+            if provenance is None:
+                return False
+
+            # Snapshot what the graph needs before the commit expires the instance.
+            provenance_payload = {
+                "left_type": provenance.left_type,
+                "right_type": provenance.right_type,
+                "relation_type": provenance.relation_type,
+                "left": provenance.left,
+                "right": provenance.right,
+                "user_id": provenance.user_id,
+            }
+            session.delete(provenance)
+            session.commit()
 
-                return True
+        if self.cache_enabled():
+            self.delete_node_relationship(provenance_payload=provenance_payload)
 
-            return False
+        return True
 
     def create_node_relationship(self, provenance_payload):
         """
         Create edge between two nodes
         """
-        with self.graph_db.session() as session:
-            # if node 1 is not created yet create node
+        user_id = provenance_payload.get("user_id")
+        query = merge_relationship_query(
+            provenance_payload.get("left_type"),
+            provenance_payload.get("right_type"),
+            provenance_payload.get("relation_type"),
+            user_id is not None,
+        )
 
-            left_node_query = (
-                f"Merge (n: {provenance_payload.get('left_type')}"
-                + f"{{id: '{provenance_payload.get('left')}' , "
-                + f"concept:'{provenance_payload.get('concept','.')}'}} )"
-            )
-
-            session.run(left_node_query)
-
-            # if node 2 is not created yet create node
-
-            right_node_query = (
-                f"Merge (n: {provenance_payload.get('right_type')}"
-                + f"{{id: '{provenance_payload.get('right')}' , concept:'.'}} )"
-            )
-
-            session.run(right_node_query)
-
-            def user_id_str(user_id):
-                if user_id is not None:
-                    return " { user_id: $user_id}"
-                return ""
-
-            edge_query = (
-                f"Match (n1: {provenance_payload.get('left_type')} ) "
-                + "Where n1.id = $left_id "
-                + f"Match (n2: {provenance_payload.get('right_type')} ) "
-                + "Where n2.id = $right_id "
-                + "Merge (n1)-[:"
-                + provenance_payload.get("relation_type")
-                + user_id_str(provenance_payload.get("user_id"))
-                + "]->(n2)"
-            )
-
-            session.run(
-                edge_query,
-                left_id=provenance_payload.get("left"),
-                right_id=provenance_payload.get("right"),
-                user_id=provenance_payload.get("user_id", None),
+        with self.graph_db.session() as session:
+            session.execute_write(
+                lambda tx: tx.run(
+                    query,
+                    left_id=provenance_payload.get("left"),
+                    right_id=provenance_payload.get("right"),
+                    # Kept as a string to match the nodes that already exist
+                    concept=str(provenance_payload.get("concept", ".")),
+                    user_id=user_id,
+                ).consume()
             )
 
     def delete_node_relationship(self, provenance_payload):
         """
         Delete edge between two nodes
         """
+        query = delete_relationship_query(
+            provenance_payload.get("left_type"),
+            provenance_payload.get("right_type"),
+            provenance_payload.get("relation_type"),
+        )
         with self.graph_db.session() as session:
-            query = (
-                f"Match (n1: {provenance_payload.get('left_type')} ) "
-                + "Where n1.id = $left "
-                + f"Match (n2: {provenance_payload.get('right_type')} ) "
-                + "Where n2.id = $right "
-                + "Match (n1)-[r:"
-                + provenance_payload.get("relation_type")
-                # + " {user_id : $user_id}"
-                + "]->(n2)"
-                + "Delete r"
-            )
-
             session.run(
                 query,
                 left=provenance_payload.get("left"),
@@ -1,7 +1,8 @@
 """
 Helper functions
 """
-from typing import List
+from enum import Enum
+from typing import List, Type
 
 from fastapi import HTTPException
 
@@ -25,6 +26,20 @@ def dynamic_relationship_direction(direction, relationship_type):
     )
 
 
+def cypher_label(enum_type: Type[Enum], value) -> str:
+    """
+    Return a node label or relationship type that is safe to inline in a query.
+    Labels cannot be passed as query parameters so they are checked against the
+    given enum instead.
+    """
+    try:
+        return enum_type(value).value
+    except ValueError as error:
+        raise HTTPException(
+            status_code=400, detail=f"{value} is not a valid {enum_type.__name__}."
+        ) from error
+
+
 def extracted_models_query_generator(root_type: ProvenanceType, root_id):
     """
     return all models that were derived from a document or code
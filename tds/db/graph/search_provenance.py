@@ -26,7 +26,7 @@ class SearchProvenance:
     """
 
     def __init__(self, rdb: Engine, graph_db: Optional[Driver] = None):
-        self.__connection__ = rdb.connect()
+        self.rdb = rdb
         self.graph_db = graph_db
 
     def __getitem__(self, key):
@@ -286,14 +286,10 @@ class SearchProvenance:
                 return labels(n) as label, n.id as id 
                 """
             response = session.run(query)
-            response_data = [
-                {res.data().get("label")[0]: res.data().get("id")} for res in response
-            ]
 
             counts = defaultdict(int)
-            for response in response_data:
-                for key in response:
-                    counts[key] += 1
+            for label, _ in response.values("label", "id"):
+                counts[label[0]] += 1
         return counts
 
     def models_from_code(self, payload):
@@ -311,11 +307,11 @@ class SearchProvenance:
 
             query = """
             MATCH (c:Code)<-[r:EXTRACTED_FROM]-(m:Model {id: $model_id})
-            RETURN c
+            RETURN DISTINCT c.id AS id
             """
 
             response = session.run(query, {"model_id": model_id})
-            response_data = list(set([res.data()["c"]["id"] for res in response]))
+            response_data = response.value("id")
         return response_data
 
     def models_from_document(self, payload):
@@ -333,11 +329,11 @@ class SearchProvenance:
 
             query = """
             MATCH (d:Document)<-[r:EXTRACTED_FROM]-(m:Model {id: $model_id})
-            RETURN d
+            RETURN DISTINCT d.id AS id
             """
 
             response = session.run(query, {"model_id": model_id})
-            response_data = list(set([res.data()["d"]["id"] for res in response]))
+            response_data = response.value("id")
         return response_data
 
     def models_from_equation(self, payload):
@@ -355,11 +351,11 @@ class SearchProvenance:
 
             query = """
             MATCH (e:Equation)<-[r:EXTRACTED_FROM]-(m:Model {id: $model_id})
-            RETURN e
+            RETURN DISTINCT e.id AS id
             """
 
             response = session.run(query, {"model_id": model_id})
-            response_data = list(set([res.data()["e"]["id"] for res in response]))
+            response_data = response.value("id")
         return response_data
 
     def extracted_models(self, payload):
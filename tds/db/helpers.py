@@ -1,9 +1,10 @@
 """
 Easy initialization and deletion of db content
 """
-from typing import Any
+from typing import Any, List, Union
 
-from sqlalchemy.engine.base import Connection
+from sqlalchemy import insert
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.orm import Session
 
 from tds.db.base import RelationalDatabaseBase
@@ -23,19 +24,19 @@ def drop_content(connection: Connection):
     return RelationalDatabaseBase.metadata.drop_all(connection)
 
 
-def entry_exists(connection: Connection, orm_type: Any, orm_id: int) -> bool:
+def entry_exists(bind: Union[Engine, Connection], orm_type: Any, orm_id: int) -> bool:
     """
     Check if entry exists
     """
-    with Session(connection) as session:
+    with Session(bind) as session:
         return session.query(orm_type).filter(orm_type.id == orm_id).count() == 1
 
 
-def list_by_id(connection: Connection, orm_type: Any, page_size: int, page: int = 0):
+def list_by_id(rdb: Engine, orm_type: Any, page_size: int, page: int = 0):
     """
     Page through table using given ORM
     """
-    with Session(connection) as session:
+    with Session(rdb) as session:
         return (
             session.query(orm_type)
             .order_by(orm_type.id.asc())
@@ -45,6 +46,14 @@ def list_by_id(connection: Connection, orm_type: Any, page_size: int, page: int
         )
 
 
+def bulk_insert(session: Session, orm_type: Any, rows: List[dict]):
+    """
+    Insert many rows using a single executemany INSERT
+    """
+    if rows:
+        session.execute(insert(orm_type), rows)
+
+
 def ensure_models_are_loaded():
     """
     Ensures that all modules are fully loaded so that the the Pydantic registry is full.
@@ -3,13 +3,23 @@ The configured DB engine
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
 
 from tds.settings import settings
 
 # pylint: disable-next=line-too-long
 url = f"postgresql+psycopg2://{settings.SQL_USER}:{settings.SQL_PASSWORD}@{settings.SQL_URL}:{settings.SQL_PORT}/{settings.SQL_DB}"
+
 engine = create_engine(
-    url, pool_size=25, max_overflow=10, connect_args={"connect_timeout": 8}
+    url,
+    poolclass=QueuePool,
+    pool_size=settings.SQL_POOL_SIZE,
+    max_overflow=settings.SQL_MAX_OVERFLOW,
+    # Pessimistically test pooled connections so stale ones are replaced
+    # instead of surfacing as errors in a request.
+    pool_pre_ping=True,
+    pool_recycle=settings.SQL_POOL_RECYCLE,
+    connect_args={"connect_timeout": 8},
 )
 
 
@@ -9,7 +9,7 @@ from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Session
 
 from tds.db import rdb as rdb_engine
-from tds.lib.s3 import copy_object, get_file_path, parse_filename
+from tds.lib.s3 import copy_objects, get_file_path, parse_filename
 from tds.modules.dataset.model import (
     Dataset,
     QualifierPayload,
@@ -121,6 +121,7 @@ def copy_simulation_result_to_dataset(simulation: Simulation):
     dataset = Dataset(**dataset_obj)
     dataset.save()
     if simulation["result_files"]:
+        paths = []
         for result_file in simulation["result_files"]:
             filename = parse_filename(result_file)
             origin_path = get_file_path(
@@ -129,6 +130,7 @@ def copy_simulation_result_to_dataset(simulation: Simulation):
             dest_path = get_file_path(
                 entity_id=dataset.id, file_name=filename, path=settings.S3_DATASET_PATH
             )
-            copy_object(origin_path=origin_path, destination_path=dest_path)
+            paths.append((origin_path, dest_path))
+        copy_objects(paths)
 
     return {"id": dataset.id}
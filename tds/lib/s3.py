@@ -1,19 +1,45 @@
 """
 TDS S3 storage.
 """
+import hashlib
+import hmac
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import parse_qs, quote, urlsplit
 
 import boto3
+from botocore.credentials import ReadOnlyCredentials
 
 from tds.settings import settings
 
+PRESIGNED_URL_EXPIRATION = 1500
+PRESIGN_HTTP_METHODS = {"get_object": "GET", "put_object": "PUT"}
 
+
+@lru_cache(maxsize=1)
+def s3_session():
+    """
+    Function sets up the boto3 session shared by the S3 client and presigned
+    URLs, so both sign with the same, refreshed, credentials.
+    """
+    return boto3.session.Session()
+
+
+@lru_cache(maxsize=1)
 def s3_client():
     """
-    Function sets up an S3 client based on env settings.
+    Function sets up an S3 client based on env settings. The client is created
+    once and shared since boto3 clients are thread safe, so its connection pool
+    is sized for concurrent callers.
     """
     s3_opts = {
-        "config": boto3.session.Config(signature_version="s3v4"),
+        "config": boto3.session.Config(
+            signature_version="s3v4",
+            max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+        ),
     }
     if settings.STORAGE_HOST:
         s3_opts["endpoint_url"] = settings.STORAGE_HOST
@@ -21,7 +47,7 @@ def s3_client():
         # @TODO: Deprecate this and use AWS_DEFAULT_REGION in ENV.
         s3_opts["region_name"] = settings.AWS_REGION
 
-    s3_ = boto3.client("s3", **s3_opts)
+    s3_ = s3_session().client("s3", **s3_opts)
 
     return s3_
 
@@ -33,17 +59,119 @@ def get_file_path(entity_id: str | int, file_name: str, path: str) -> str:
     return os.path.join(path, str(entity_id), file_name)
 
 
+@lru_cache(maxsize=1)
+def presign_endpoint() -> tuple[str, str, str, str]:
+    """
+    Function returns the scheme, host, key prefix and signing region of
+    presigned URLs. They are read once from a URL generated by botocore, so
+    its endpoint rules (custom hosts, regions, dotted buckets) are followed.
+    """
+    url = urlsplit(
+        s3_client().generate_presigned_url(
+            ClientMethod="get_object",
+            Params={"Bucket": settings.S3_BUCKET, "Key": "key"},
+        )
+    )
+    credential = parse_qs(url.query)["X-Amz-Credential"][0]
+    region = credential.split("/")[2]
+    return url.scheme, url.netloc, url.path[: -len("/key")], region
+
+
+@lru_cache(maxsize=8)
+def signing_key(secret_key: str, date_stamp: str, region: str) -> bytes:
+    """
+    Function derives the SigV4 signing key, which only changes once a day.
+    """
+    key = f"AWS4{secret_key}".encode("utf-8")
+    for part in (date_stamp, region, "s3", "aws4_request"):
+        key = hmac.new(key, part.encode("utf-8"), hashlib.sha256).digest()
+    return key
+
+
+def sign_presigned_url(
+    s3_key: str,
+    http_method: str,
+    credentials: ReadOnlyCredentials,
+    expires_in: int = PRESIGNED_URL_EXPIRATION,
+) -> str:
+    """
+    Function builds a SigV4 query-string presigned URL directly, without going
+    through botocore's request signing machinery for every URL.
+    """
+    now = datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = now.strftime("%Y%m%d")
+    scheme, host, prefix, region = presign_endpoint()
+    scope = f"{date_stamp}/{region}/s3/aws4_request"
+
+    canonical_uri = quote(f"{prefix}/{s3_key}", safe="/")
+    query = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{credentials.access_key}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires_in),
+        "X-Amz-SignedHeaders": "host",
+    }
+    if credentials.token:
+        query["X-Amz-Security-Token"] = credentials.token
+    quoted = {
+        quote(key, safe=""): quote(value, safe="") for key, value in query.items()
+    }
+    canonical_query = "&".join(
+        f"{key}={value}" for key, value in sorted(quoted.items())
+    )
+    canonical_request = "\n".join(
+        [
+            http_method,
+            canonical_uri,
+            canonical_query,
+            f"host:{host}\n",
+            "host",
+            "UNSIGNED-PAYLOAD",
+        ]
+    )
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ]
+    )
+    signature = hmac.new(
+        signing_key(credentials.secret_key, date_stamp, region),
+        string_to_sign.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+
+    return (
+        f"{scheme}://{host}{canonical_uri}?"
+        + "&".join(f"{key}={value}" for key, value in quoted.items())
+        + f"&X-Amz-Signature={signature}"
+    )
+
+
 def get_presigned_url(entity_id: str | int, file_name: str, method: str, path: str):
     """
     Function generates a presigned URL for the HMI client.
     """
-    s3_ = s3_client()
     s3_key = get_file_path(entity_id=entity_id, file_name=file_name, path=path)
 
+    http_method: Optional[str] = PRESIGN_HTTP_METHODS.get(method)
+    credentials = s3_session().get_credentials()
+    if http_method and credentials is not None:
+        # Refreshable credentials (e.g. instance roles) are renewed here.
+        return sign_presigned_url(
+            s3_key=s3_key,
+            http_method=http_method,
+            credentials=credentials.get_frozen_credentials(),
+        )
+
+    s3_ = s3_client()
     presigned_url = s3_.generate_presigned_url(
         ClientMethod=method,
         Params={"Bucket": settings.S3_BUCKET, "Key": s3_key},
-        ExpiresIn=1500,
+        ExpiresIn=PRESIGNED_URL_EXPIRATION,
     )
 
     return presigned_url
@@ -63,6 +191,24 @@ def copy_object(origin_path: str, destination_path: str):
     return response
 
 
+def copy_objects(paths: list[tuple[str, str]]) -> list:
+    """
+    Function copies many objects in s3 concurrently. Each copy is a blocking
+    request, so they are fanned out over threads sharing the cached client.
+    """
+    if not paths:
+        return []
+
+    max_workers = min(len(paths), settings.S3_MAX_POOL_CONNECTIONS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda path: copy_object(origin_path=path[0], destination_path=path[1]),
+                paths,
+            )
+        )
+
+
 def parse_filename(path: str):
     """
     Function grabs filename via brute force.
@@ -106,7 +106,7 @@ def software_put(
     Update software record in DB
     """
     try:
-        if entry_exists(rdb.connect(), Software, software_id):
+        if entry_exists(rdb, Software, software_id):
             software_payload = payload.dict()
             software_payload.pop("id")
             with Session(rdb) as session:
@@ -143,7 +143,7 @@ def software_delete(
     Delete software record in DB
     """
     try:
-        if entry_exists(rdb.connect(), Software, software_id):
+        if entry_exists(rdb, Software, software_id):
             with Session(rdb) as session:
                 session.query(Software).filter(Software.id == software_id).delete()
                 session.commit()
@@ -196,11 +196,13 @@ def publication_post(
     publication_payload = payload.dict()
     xdd_uri = str(publication_payload["xdd_uri"])
     with Session(rdb) as session:
-        publications = (
-            session.query(Publication).filter(Publication.xdd_uri == xdd_uri).all()
+        # Only the id is needed to detect a duplicate, so the potentially large
+        # publication_data column is not fetched.
+        existing = (
+            session.query(Publication.id).filter(Publication.xdd_uri == xdd_uri).first()
         )
 
-        if len(publications) < 1:
+        if existing is None:
             publication = Publication(**publication_payload)
             session.add(publication)
             session.commit()
@@ -219,7 +221,7 @@ def publication_post(
             },
             content={
                 "message": f"Publication with xdd_uri of {xdd_uri} exists",
-                "id": publications[0].id,
+                "id": existing.id,
             },
         )
 
@@ -265,7 +267,7 @@ def publication_put(
     Update a publication and return its ID
     """
     try:
-        if entry_exists(rdb.connect(), Publication, publication_id):
+        if entry_exists(rdb, Publication, publication_id):
             publication_payload = payload.dict()
             publication_payload.pop("id")
             with Session(rdb) as session:
@@ -304,7 +306,7 @@ def publication_delete(
     Delete publication record in DB
     """
     try:
-        if entry_exists(rdb.connect(), Publication, publication_id):
+        if entry_exists(rdb, Publication, publication_id):
             with Session(rdb) as session:
                 session.query(Publication).filter(
                     Publication.id == publication_id
@@ -14,7 +14,11 @@ from fastapi.responses import JSONResponse
 from tds.db import es_client
 from tds.modules.model.model import Model
 from tds.modules.model.model_description import ModelDescription
-from tds.modules.model.utils import model_list_response, model_response
+from tds.modules.model.utils import (
+    model_list_response,
+    model_list_source_excludes,
+    model_response,
+)
 from tds.modules.model_configuration.model import ModelConfiguration
 from tds.modules.model_configuration.response import (
     ModelConfigurationResponse,
@@ -40,7 +44,7 @@ def list_models(page_size: int = 100, page: int = 0) -> JSONResponse:
     """
     list_body = {
         "size": page_size,
-        "source_excludes": ["model", "semantics"],
+        "source_excludes": model_list_source_excludes,
     }
     if page != 0:
         list_body["from"] = page
@@ -76,7 +80,7 @@ def search_models(
     """
     list_body = {
         "size": page_size,
-        "source_excludes": ["model", "semantics"],
+        "source_excludes": model_list_source_excludes,
         "query": payload,
     }
     if page != 0:
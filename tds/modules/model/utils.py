@@ -17,7 +17,6 @@ model_list_fields = [
     "id",
     "header",
     "name",
-    "model",
     "description",
     "schema",
     "schema_name",
@@ -25,6 +24,9 @@ model_list_fields = [
     "timestamp",
 ]
 
+# Large model bodies that list responses never include.
+model_list_source_excludes = ["model", "semantics"]
+
 
 def orm_to_params(parameters: List):
     """
@@ -8,7 +8,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm.exc import NoResultFound
 
 from tds.db import entry_exists, list_by_id, request_rdb
@@ -34,7 +34,7 @@ def list_persons(
     """
     Page over persons
     """
-    people = list_by_id(rdb.connect(), Person, page_size, page)
+    people = list_by_id(rdb, Person, page_size, page)
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         headers={
@@ -114,7 +114,7 @@ def person_put(
     Update a person object.
     """
     try:
-        if entry_exists(rdb.connect(), Person, person_id):
+        if entry_exists(rdb, Person, person_id):
             with Session(rdb) as session:
                 project_payload = payload.dict()
 
@@ -148,7 +148,7 @@ def person_delete(person_id: int, rdb: Engine = Depends(request_rdb)) -> JSONRes
     Delete a Person
     """
     try:
-        if entry_exists(rdb.connect(), Person, person_id):
+        if entry_exists(rdb, Person, person_id):
             with Session(rdb) as session:
                 person = session.query(Person).filter(Person.id == person_id).first()
                 session.delete(person)
@@ -183,17 +183,22 @@ def person_associations(
     Retrieve a person's associations.
     """
     try:
-        if entry_exists(rdb.connect(), Person, person_id):
-            with Session(rdb) as session:
-                person = session.query(Person).get(person_id)
-                return JSONResponse(
-                    status_code=status.HTTP_200_OK,
-                    headers={
-                        "content-type": "application/json",
-                    },
-                    content=jsonable_encoder(person.associations),
-                )
-        raise NoResultFound
+        with Session(rdb) as session:
+            person = (
+                session.query(Person)
+                .options(selectinload(Person.associations))
+                .filter(Person.id == person_id)
+                .one_or_none()
+            )
+        if person is None:
+            raise NoResultFound
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            headers={
+                "content-type": "application/json",
+            },
+            content=jsonable_encoder(person.associations),
+        )
     except NoResultFound as error:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -214,7 +219,7 @@ def create_association(
     Create a person -> association record.
     """
     try:
-        if entry_exists(rdb.connect(), Person, person_id):
+        if entry_exists(rdb, Person, person_id):
             with Session(rdb) as session:
                 person = session.query(Person).get(person_id)
                 association = Association(**payload.dict())
@@ -251,8 +256,8 @@ def delete_association(
     """
     try:
         print(f"Deleting Record...Person:{person_id} -> Association:{association_id}")
-        if entry_exists(rdb.connect(), Person, person_id) and entry_exists(
-            rdb.connect(), Association, association_id
+        if entry_exists(rdb, Person, person_id) and entry_exists(
+            rdb, Association, association_id
         ):
             with Session(rdb) as session:
                 person = session.query(Person).get(person_id)
@@ -294,8 +299,8 @@ def get_association(
     Get a specific association by ID
     """
     try:
-        if entry_exists(rdb.connect(), Person, person_id) and entry_exists(
-            rdb.connect(), Association, association_id
+        if entry_exists(rdb, Person, person_id) and entry_exists(
+            rdb, Association, association_id
         ):
             with Session(rdb) as session:
                 association = session.query(Association).get(association_id)
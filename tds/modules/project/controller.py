@@ -10,15 +10,14 @@ from fastapi import status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from sqlalchemy.engine.base import Engine
-from sqlalchemy.orm import Query, Session
-from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy.orm import Session
 
-from tds.db import entry_exists, es_client, request_rdb
+from tds.db import es_client, request_rdb
 from tds.db.enums import ResourceType
 from tds.modules.project.helpers import (
+    RESOURCE_META,
     ResourceDoesNotExist,
     adjust_project_assets,
-    es_list_response,
     es_resources,
     save_project,
 )
@@ -26,7 +25,6 @@ from tds.modules.project.model import Project, ProjectAsset, ProjectPayload
 from tds.modules.project.response import ProjectResponse
 from tds.operation import create, delete, retrieve, update
 from tds.schema.resource import get_resource_orm
-from tds.settings import settings
 
 project_router = APIRouter()
 logger = Logger(__name__)
@@ -99,29 +97,22 @@ def project_get(project_id: int, rdb: Engine = Depends(request_rdb)) -> JSONResp
     """
     Retrieve a project from ElasticSearch
     """
-    try:
-        if entry_exists(rdb.connect(), Project, project_id):
-            with Session(rdb) as session:
-                project = session.query(Project).get(project_id)
-                # pylint: disable-next=unused-variable
-                parameters: Query[ProjectAsset] = session.query(ProjectAsset).filter(
-                    ProjectAsset.project_id == project_id
-                )
-        else:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    with Session(rdb) as session:
+        project = session.get(Project, project_id)
 
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            headers={"content-type": "application/json"},
-            content=jsonable_encoder(project),
-        )
-    except NoResultFound:
+    if project is None:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             headers={"content-type": "application/json"},
             content={"message": f"The project with id {project_id} was not found."},
         )
 
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        headers={"content-type": "application/json"},
+        content=jsonable_encoder(project),
+    )
+
 
 @project_router.put("/{project_id}", **update.fastapi_endpoint_config)
 def project_put(
@@ -131,30 +122,31 @@ def project_put(
     Update a project.
     """
     try:
-        if entry_exists(rdb.connect(), Project, project_id):
-            with Session(rdb) as session:
-                project_payload = payload.dict()
-                assets = project_payload.pop("assets")
-                if "concept" in project_payload:
-                    # pylint: disable-next=unused-variable
-                    concept_payload = project_payload.pop(
-                        "concept"
-                    )  # TODO: Save ontology term
-
-                session.query(Project).filter(Project.id == project_id).update(
-                    project_payload
-                )
-                adjust_project_assets(project_id, assets, session)
-                session.commit()
+        with Session(rdb) as session:
+            project_payload = payload.dict()
+            assets = project_payload.pop("assets")
+            if "concept" in project_payload:
+                # pylint: disable-next=unused-variable
+                concept_payload = project_payload.pop(
+                    "concept"
+                )  # TODO: Save ontology term
 
-            logger.info("new project created: %i", project_id)
-            return JSONResponse(
-                status_code=status.HTTP_202_ACCEPTED,
-                headers={"content-type": "application/json"},
-                content={"id": project_id},
+            updated = (
+                session.query(Project)
+                .filter(Project.id == project_id)
+                .update(project_payload)
             )
+            if updated == 0:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+            adjust_project_assets(project_id, assets, session)
+            session.commit()
 
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        logger.info("new project created: %i", project_id)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"content-type": "application/json"},
+            content={"id": project_id},
+        )
     except ResourceDoesNotExist as error:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -168,27 +160,15 @@ def project_delete(project_id: int, rdb: Engine = Depends(request_rdb)) -> JSONR
     """
     Deactivate project
     """
-    try:
-        if entry_exists(rdb.connect(), Project, project_id):
-            with Session(rdb) as session:
-                project = session.query(Project).get(project_id)
-
-            # set to dict and active to false
-            project_ = project.__dict__
-            project_.pop("_sa_instance_state")
-            project_["active"] = False
-
-            with Session(rdb) as session:
-                session.query(Project).filter(Project.id == project_id).update(project_)
-                session.commit()
-
-        else:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-        return JSONResponse(
-            headers={"content-type": "application/json"},
-            content={"id": project_id, "status": project_["active"]},
+    with Session(rdb) as session:
+        updated = (
+            session.query(Project)
+            .filter(Project.id == project_id)
+            .update({Project.active: False}, synchronize_session=False)
         )
-    except NoResultFound:
+        session.commit()
+
+    if updated == 0:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             headers={"content-type": "application/json"},
@@ -197,6 +177,10 @@ def project_delete(project_id: int, rdb: Engine = Depends(request_rdb)) -> JSONR
                 "message": f"Project with ID {project_id} not found.",
             },
         )
+    return JSONResponse(
+        headers={"content-type": "application/json"},
+        content={"id": project_id, "status": False},
+    )
 
 
 @project_router.delete(
@@ -213,19 +197,18 @@ def delete_asset(
     Remove asset
     """
     with Session(rdb) as session:
-        project_assets = list(
-            session.query(ProjectAsset).filter(
+        # Duplicate rows may exist for the same asset, they are all removed.
+        deleted = (
+            session.query(ProjectAsset)
+            .filter(
                 ProjectAsset.project_id == project_id,
                 ProjectAsset.resource_type == resource_type,
                 ProjectAsset.resource_id == str(resource_id),
             )
+            .delete(synchronize_session=False)
         )
-        if len(project_assets) == 0:
+        if deleted == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-        # Loop through assets because the result is an array and if there are
-        # more than one result, we want to remove it anyway.
-        for asset in project_assets:
-            session.delete(asset)
         session.commit()
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -248,17 +231,17 @@ def create_asset(
     Create asset and return its ID
     """
     with Session(rdb) as session:
-        identical_count = (
+        asset_exists = session.query(
             session.query(ProjectAsset)
             .filter(
                 ProjectAsset.project_id == project_id,
                 ProjectAsset.resource_id == str(resource_id),
                 ProjectAsset.resource_type == resource_type,
             )
-            .count()
-        )
+            .exists()
+        ).scalar()
 
-        if identical_count == 0:
+        if not asset_exists:
             project_asset = ProjectAsset(
                 project_id=project_id,
                 resource_id=str(resource_id),
@@ -303,41 +286,63 @@ def get_project_assets(
     """
     Retrieve project assets
     """
-    if entry_exists(rdb.connect(), Project, project_id):
-        with Session(rdb) as session:
-            project = session.query(Project).get(project_id)
-            assets = project.assets
-            assets_key_ids = {type: [] for type in types}
-            for asset in list(assets):
-                if asset.resource_type in types:
-                    assets_key_ids[asset.resource_type].append(asset.resource_id)
-
-            assets_key_objects = {}
-            for key in assets_key_ids:
-                orm_type = get_resource_orm(key)
-                if key in es_resources:
-                    responder = es_list_response[key]
-                    index_singular = key if key[-1] != "s" else key.rstrip("s")
-                    index = f"{settings.ES_INDEX_PREFIX}{index_singular}"
-                    es_items = es.search(
-                        index=index,
-                        query={"ids": {"values": assets_key_ids[key]}},
-                        fields=responder["fields"],
-                        size=1000,
-                    )
-                    assets_key_objects[key] = (
-                        []
-                        if es_items["hits"]["total"]["value"] == 0
-                        else responder["function"](es_items["hits"]["hits"])
-                    )
-                else:
-                    assets_key_objects[key] = (
-                        session.query(orm_type)
-                        .filter(orm_type.id.in_(assets_key_ids[key]))
-                        .all()
-                    )
-    else:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    with Session(rdb) as session:
+        if session.get(Project, project_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+        # Only the two columns needed for bucketing are fetched, and only for
+        # the requested types.
+        assets_key_ids = {type: [] for type in types}
+        for resource_type, resource_id in session.query(
+            ProjectAsset.resource_type, ProjectAsset.resource_id
+        ).filter(
+            ProjectAsset.project_id == project_id,
+            ProjectAsset.resource_type.in_(types),
+        ):
+            assets_key_ids[resource_type].append(resource_id)
+
+        # Types without any assets are answered without a query.
+        assets_key_objects = {key: [] for key in assets_key_ids}
+
+        # All ElasticSearch backed types are fetched in a single msearch.
+        es_keys = [
+            key for key, ids in assets_key_ids.items() if ids and key in es_resources
+        ]
+        searches = []
+        for key in es_keys:
+            meta = RESOURCE_META[key]
+            searches.append({"index": meta.index})
+            search = {
+                "query": {"ids": {"values": assets_key_ids[key]}},
+                "size": 1000,
+            }
+            if meta.fields:
+                search["fields"] = meta.fields
+            if meta.source_excludes:
+                search["_source"] = {"excludes": meta.source_excludes}
+            searches.append(search)
+        es_responses = es.msearch(searches=searches)["responses"] if searches else []
+
+        for key, es_items in zip(es_keys, es_responses):
+            if "error" in es_items:
+                logger.error("Failed to search %s assets: %s", key, es_items["error"])
+                raise HTTPException(
+                    status_code=status.HTTP_502_BAD_GATEWAY,
+                    detail=f"ElasticSearch search for {key.value} assets failed.",
+                )
+            assets_key_objects[key] = (
+                []
+                if es_items["hits"]["total"]["value"] == 0
+                else RESOURCE_META[key].function(es_items["hits"]["hits"])
+            )
+
+        for key, ids in assets_key_ids.items():
+            if not ids or key in es_resources:
+                continue
+            orm_type = get_resource_orm(key)
+            assets_key_objects[key] = (
+                session.query(orm_type).filter(orm_type.id.in_(ids)).all()
+            )
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         headers={"content-type": "application/json"},
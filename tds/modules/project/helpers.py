@@ -2,41 +2,79 @@
 TDS Project helpers.
 """
 from collections import defaultdict
-from typing import Dict, List
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 from sqlalchemy.orm import Session
 
-from tds.db import entry_exists, es_client, rdb
-from tds.lib.utils import get_singular_index
+from tds.db import bulk_insert, es_client
+from tds.modules.artifact.model import Artifact
 from tds.modules.artifact.response import artifact_response
+from tds.modules.code.model import Code
 from tds.modules.code.response import code_response
+from tds.modules.dataset.model import Dataset
 from tds.modules.dataset.response import dataset_response
+from tds.modules.document.model import Document
 from tds.modules.document.response import document_response
+from tds.modules.equation.model import Equation
 from tds.modules.equation.response import equation_response
-from tds.modules.model.utils import model_list_fields, model_list_response
+from tds.modules.model.model import Model
+from tds.modules.model.utils import (
+    model_list_fields,
+    model_list_response,
+    model_list_source_excludes,
+)
+from tds.modules.model_configuration.model import ModelConfiguration
 from tds.modules.model_configuration.response import configuration_response
 from tds.modules.project.model import Project, ProjectAsset
+from tds.modules.simulation.model import Simulation
 from tds.modules.simulation.response import simulation_response
+from tds.modules.workflow.model import Workflow
 from tds.modules.workflow.response import workflow_response
 from tds.schema.resource import ResourceType, get_resource_orm
-from tds.settings import settings
-
-es_list_response = {
-    ResourceType.models: {"function": model_list_response, "fields": model_list_fields},
-    ResourceType.model_configurations: {
-        "function": configuration_response,
-        "fields": None,
-    },
-    ResourceType.datasets: {"function": dataset_response, "fields": None},
-    ResourceType.simulations: {"fields": None, "function": simulation_response},
-    ResourceType.workflows: {"fields": None, "function": workflow_response},
-    ResourceType.artifacts: {"fields": None, "function": artifact_response},
-    ResourceType.code: {"fields": None, "function": code_response},
-    ResourceType.documents: {"fields": None, "function": document_response},
-    ResourceType.equations: {"fields": None, "function": equation_response},
+
+
+class ResourceMeta(NamedTuple):
+    """
+    Search parameters for an ElasticSearch backed asset type.
+    """
+
+    index: str
+    function: Callable
+    fields: Optional[List[str]] = None
+    source_excludes: Optional[List[str]] = None
+
+
+# Built once at import, keyed by asset type.
+RESOURCE_META: Dict[ResourceType, ResourceMeta] = {
+    ResourceType.models: ResourceMeta(
+        index=Model.index,
+        function=model_list_response,
+        fields=model_list_fields,
+        source_excludes=model_list_source_excludes,
+    ),
+    ResourceType.model_configurations: ResourceMeta(
+        index=ModelConfiguration.index, function=configuration_response
+    ),
+    ResourceType.datasets: ResourceMeta(index=Dataset.index, function=dataset_response),
+    ResourceType.simulations: ResourceMeta(
+        index=Simulation.index, function=simulation_response
+    ),
+    ResourceType.workflows: ResourceMeta(
+        index=Workflow.index, function=workflow_response
+    ),
+    ResourceType.artifacts: ResourceMeta(
+        index=Artifact.index, function=artifact_response
+    ),
+    ResourceType.code: ResourceMeta(index=Code.index, function=code_response),
+    ResourceType.documents: ResourceMeta(
+        index=Document.index, function=document_response
+    ),
+    ResourceType.equations: ResourceMeta(
+        index=Equation.index, function=equation_response
+    ),
 }
 
-es_resources = list(es_list_response.keys())
+es_resources = list(RESOURCE_META.keys())
 
 
 class ResourceDoesNotExist(Exception):
@@ -55,12 +93,14 @@ def save_project(project: dict, session):
     Function saves the project from a payload dict.
     """
     asset_dict = project.pop("assets")
-    assets = check_assets(assets=asset_dict)
+    assets = check_assets(assets=asset_dict, session=session)
 
     if assets:
         project = Project(**project)
         session.add(project)
-        session.commit()
+        # Flush to get the project id so the project and its assets are
+        # written in a single transaction.
+        session.flush()
         build_asset_records(
             project_id=project.id, asset_ids=asset_dict, session=session
         )
@@ -68,7 +108,7 @@ def save_project(project: dict, session):
     return project
 
 
-def check_assets(assets: list) -> bool:
+def check_assets(assets: list, session: Session) -> bool:
     """
     Function verifies assets exist before saving the project.
     """
@@ -79,7 +119,9 @@ def check_assets(assets: list) -> bool:
             )
         else:
             resources = handle_orm_resource(
-                object_resource=resource_type, object_ids=assets[resource_type]
+                object_resource=resource_type,
+                object_ids=assets[resource_type],
+                session=session,
             )
 
         if resources is False:
@@ -93,7 +135,7 @@ def handle_es_resource(object_resource: str, object_ids: list):
     Function handles an ElasticSearch asset resource.
     """
     es = es_client()
-    index = get_singular_index(f"{settings.ES_INDEX_PREFIX}{object_resource}")
+    index = RESOURCE_META[object_resource].index
     query = {"ids": {"values": object_ids}}
     res = es.search(index=index, query=query)
 
@@ -103,12 +145,21 @@ def handle_es_resource(object_resource: str, object_ids: list):
     return True
 
 
-def handle_orm_resource(object_resource: ResourceType, object_ids: list):
+def handle_orm_resource(
+    object_resource: ResourceType, object_ids: list, session: Session
+):
     """
     Function handles ORM project assets.
     """
     current_orm = get_resource_orm(object_resource)
-    if not all((entry_exists(rdb.connect(), current_orm, oid) for oid in object_ids)):
+    requested_ids = {str(oid) for oid in object_ids}
+    existing_ids = {
+        str(oid)
+        for (oid,) in session.query(current_orm.id).filter(
+            current_orm.id.in_(object_ids)
+        )
+    }
+    if existing_ids != requested_ids:
         raise ResourceDoesNotExist(object_resource)
     return True
 
@@ -117,18 +168,17 @@ def build_asset_records(project_id, asset_ids, session):
     """
     Function builds the asset record list and saves it to the DB.
     """
-    for resource_type in asset_ids:
-        resource_ids = asset_ids[resource_type]
-        project_assets = [
-            ProjectAsset(
-                project_id=project_id,
-                resource_id=resource_id,
-                resource_type=resource_type,
-                external_ref="",
-            )
-            for resource_id in resource_ids
-        ]
-        session.bulk_save_objects(project_assets)
+    project_assets = [
+        {
+            "project_id": project_id,
+            "resource_id": str(resource_id),
+            "resource_type": resource_type,
+            "external_ref": "",
+        }
+        for resource_type, resource_ids in asset_ids.items()
+        for resource_id in resource_ids
+    ]
+    bulk_insert(session, ProjectAsset, project_assets)
 
 
 def adjust_project_assets(
@@ -143,20 +193,30 @@ def adjust_project_assets(
     ):
         active[asset.resource_type].append(asset.resource_id)
 
-    for resource_type, resource_ids in assets.items():
-        project_assets = [
-            ProjectAsset(
-                project_id=project_id,
-                resource_id=resource_id,
-                resource_type=resource_type,
-                external_ref="",
-            )
-            for resource_id in resource_ids
-            if resource_id not in active[resource_type]
-        ]
-        session.bulk_save_objects(project_assets)
+    # Resource ids are stored as strings, payload ids may be ints.
+    requested = {
+        resource_type: [str(resource_id) for resource_id in resource_ids]
+        for resource_type, resource_ids in assets.items()
+    }
+
+    new_assets = [
+        {
+            "project_id": project_id,
+            "resource_id": resource_id,
+            "resource_type": resource_type,
+            "external_ref": "",
+        }
+        for resource_type, resource_ids in requested.items()
+        for resource_id in resource_ids
+        if resource_id not in active[resource_type]
+    ]
+    bulk_insert(session, ProjectAsset, new_assets)
 
     for resource_type, resource_ids in active.items():
-        inactive_ids = set(resource_ids) - set(assets.get(resource_type, []))
-        for inactive_id in inactive_ids:
-            session.delete(session.query(ProjectAsset).get(inactive_id))
+        inactive_ids = set(resource_ids) - set(requested.get(resource_type, []))
+        if inactive_ids:
+            session.query(ProjectAsset).filter(
+                ProjectAsset.project_id == project_id,
+                ProjectAsset.resource_type == resource_type,
+                ProjectAsset.resource_id.in_(inactive_ids),
+            ).delete(synchronize_session=False)
@@ -75,6 +75,14 @@ class ProjectAsset(RelationalDatabaseBase):
     """
 
     __tablename__ = "project_asset"
+    __table_args__ = (
+        sa.Index(
+            "ix_project_asset_project_id_resource_type_resource_id",
+            "project_id",
+            "resource_type",
+            "resource_id",
+        ),
+    )
 
     id = sa.Column(sa.Integer(), primary_key=True)
     project_id = sa.Column(sa.Integer(), sa.ForeignKey("project.id"), nullable=False)
@@ -9,13 +9,11 @@ from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from sqlalchemy.engine.base import Engine
-from sqlalchemy.orm import Session
-from sqlalchemy.orm.exc import NoResultFound
 
 from tds.db import enums, request_graph_db, request_rdb
 from tds.db.graph.provenance_handler import ProvenanceHandler
 from tds.db.graph.search_provenance import SearchProvenance
-from tds.modules.provenance.model import Provenance, ProvenancePayload, ProvenanceSearch
+from tds.modules.provenance.model import ProvenancePayload, ProvenanceSearch
 from tds.modules.provenance.response import ProvenanceResponse
 from tds.operation import create, delete, retrieve
 
@@ -198,20 +196,9 @@ def provenance_get(
     """
     Retrieve a provenance from ElasticSearch
     """
-    try:
-        with Session(rdb) as session:
-            res = session.query(Provenance).get(provenance_id)
-
-        logger.info("Provenance retrieved: %s", provenance_id)
-
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            headers={
-                "content-type": "application/json",
-            },
-            content=jsonable_encoder(res),
-        )
-    except NoResultFound:
+    provenance_handler = ProvenanceHandler(rdb=rdb)
+    res = provenance_handler.retrieve(id=provenance_id)
+    if res is None:
         return Response(
             status_code=status.HTTP_404_NOT_FOUND,
             headers={
@@ -219,6 +206,16 @@ def provenance_get(
             },
         )
 
+    logger.info("Provenance retrieved: %s", provenance_id)
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        headers={
+            "content-type": "application/json",
+        },
+        content=jsonable_encoder(res),
+    )
+
 
 @provenance_router.delete("/{provenance_id}", **delete.fastapi_endpoint_config)
 def provenance_delete(
@@ -229,31 +226,9 @@ def provenance_delete(
     """
     Delete a Provenance in ElasticSearch
     """
-    try:
-        with Session(rdb) as session:
-            if (
-                session.query(Provenance).filter(Provenance.id == provenance_id).count()
-                == 1
-            ):
-                provenance_handler = ProvenanceHandler(rdb=rdb, graph_db=graph_db)
-                success = provenance_handler.delete(id=provenance_id)
-
-                success_msg = f"Provenance successfully deleted: {provenance_id}"
-
-                logger.info(success_msg)
-                return JSONResponse(
-                    status_code=status.HTTP_200_OK,
-                    headers={
-                        "content-type": "application/json",
-                    },
-                    content={
-                        "id": provenance_id,
-                        "message": success_msg,
-                        "success": success,
-                    },
-                )
-            raise NoResultFound
-    except NoResultFound:
+    provenance_handler = ProvenanceHandler(rdb=rdb, graph_db=graph_db)
+    success = provenance_handler.delete(id=provenance_id)
+    if not success:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             headers={
@@ -261,3 +236,18 @@ def provenance_delete(
             },
             content={"message": f"Provenance record for id {provenance_id} not found"},
         )
+
+    success_msg = f"Provenance successfully deleted: {provenance_id}"
+
+    logger.info(success_msg)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        headers={
+            "content-type": "application/json",
+        },
+        content={
+            "id": provenance_id,
+            "message": success_msg,
+            "success": success,
+        },
+    )
@@ -51,6 +51,17 @@ obj_to_enum: Dict[Type[Resource], ResourceType] = {
 }
 
 
+enum_to_obj: Dict[ResourceType, Type[Resource]] = {
+    type: resource for resource, type in obj_to_enum.items()
+}
+
+enum_to_orm: Dict[ResourceType, ORMResource] = {
+    enum_value: r_type
+    for r_type, enum_value in obj_to_enum.items()
+    if issubclass(r_type, ORMResource)
+}
+
+
 def get_resource_type(resource: Resource) -> Optional[ResourceType]:
     """
     Maps class to resource enum
@@ -62,7 +73,6 @@ def get_schema(resource_type: ResourceType) -> Type[Resource]:
     """
     Maps class to resource enum
     """
-    enum_to_obj = {type: resource for resource, type in obj_to_enum.items()}
     return enum_to_obj[resource_type]
 
 
@@ -70,9 +80,4 @@ def get_resource_orm(resource_type: ResourceType) -> Optional[ORMResource]:
     """
     Maps resource type to ORM
     """
-    enum_to_orm = {
-        enum_value: r_type
-        for r_type, enum_value in obj_to_enum.items()
-        if issubclass(r_type, ORMResource)
-    }
     return enum_to_orm.get(resource_type, None)
@@ -6,23 +6,42 @@ import os
 from importlib import import_module, metadata
 from pkgutil import iter_modules
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from tds.settings import settings
+
 API_DESCRIPTION = "TDS handles data between TERArium and other ASKEM components."
 
 
-def load_module_routers(api):
+def find_module_routers() -> tuple:
     """
-    Function loads the module router objects and registers them with FastAPI.
+    Function finds the modules that define a router and returns the router,
+    tags and prefix for each of them.
     """
     modules = import_module("tds.modules")
+    module_routers = []
     for mod in iter_modules(modules.__path__):
         module = import_module(f"tds.modules.{mod.name}")
         if hasattr(module, "router"):
-            api.include_router(
-                module.router, tags=module.TAGS, prefix="/" + module.ROUTE_PREFIX
+            module_routers.append(
+                (module.router, module.TAGS, "/" + module.ROUTE_PREFIX)
             )
+    return tuple(module_routers)
+
+
+# Routers are collected once on import so a broken module fails at startup
+# instead of when the API is built.
+MODULE_ROUTERS = find_module_routers()
+
+
+def load_module_routers(api):
+    """
+    Function loads the module router objects and registers them with FastAPI.
+    """
+    for router, tags, prefix in MODULE_ROUTERS:
+        api.include_router(router, tags=tags, prefix=prefix)
 
 
 def build_api() -> FastAPI:
@@ -47,6 +66,16 @@ def build_api() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @api.on_event("startup")
+    async def size_threadpool():
+        """
+        Sync route handlers run in anyio's worker threads. Size that pool to
+        the number of database connections so every connection can be used
+        concurrently without threads queueing behind the default limit.
+        """
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = settings.SQL_POOL_SIZE + settings.SQL_MAX_OVERFLOW
+
     # Load routers from the modules package.
     @api.get("/health")
     def get_health():
@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     SQL_USER: str = "dev"
     SQL_PASSWORD: str = "dev"
     SQL_DB: str = "askem"
+    SQL_POOL_SIZE: int = 25
+    SQL_MAX_OVERFLOW: int = 25
+    SQL_POOL_RECYCLE: int = 1800
     DKG_URL = "http://34.230.33.149"
     DKG_API_PORT = 8771
     DKG_DESC_PORT = 8772
@@ -31,6 +34,7 @@ class Settings(BaseSettings):
     ES_USERNAME: str = ""
     ES_PASSWORD: str = ""
     ES_INDEX_PREFIX: str = "tds_"
+    ES_CONNECTIONS_PER_NODE: int = 50
     S3_DATASET_PATH: str = "datasets"
     S3_RESULTS_PATH: str = "simulations"
     S3_ARTIFACT_PATH: str = "artifacts"
@@ -41,6 +45,7 @@ class Settings(BaseSettings):
     AWS_REGION: Optional[str] = None
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
+    S3_MAX_POOL_CONNECTIONS: int = 30
     SEED_DATA: bool = False
 
 
@@ -94,8 +94,7 @@ class ASKEMEntityTestSuite(ABC):
         """
         Enter `with` context of the `demo_api`
         """
-        routers = self.__class__().enabled_routers
-        self.ctx = demo_api_context(*routers)
+        self.ctx = demo_api_context()
         self.client, self.rdb = self.ctx.__enter__()
         self.init_test_data()
 
@@ -1,9 +1,8 @@
 """
 The reusable Test DB connection
 """
-import os
 from contextlib import contextmanager
-from sqlite3 import connect
+from functools import lru_cache
 from typing import Generator, Tuple
 
 from fastapi.testclient import TestClient
@@ -11,8 +10,10 @@ from fastapi.testclient import TestClient
 # from neo4j import GraphDatabase
 from sqlalchemy import create_engine
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.pool import StaticPool
 
 from tds.db import init_dev_content, request_graph_db, request_rdb
+from tds.db.base import RelationalDatabaseBase
 from tds.server.build import build_api
 
 # from tds.settings import settings
@@ -46,38 +47,50 @@ from tds.server.build import build_api
 #     return NEO_ENGINE
 
 
+@lru_cache(maxsize=1)
+def demo_rdb_engine() -> Engine:
+    """
+    Creates the test DB and its schema once, every test reuses it afterwards
+    """
+    # A single in-memory connection is shared across threads, so there is no
+    # per-connect cost and no file to clean up.
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        init_dev_content(connection)
+    return engine
+
+
+def clear_content(engine: Engine):
+    """
+    Remove the rows a test wrote while keeping the schema in place
+    """
+    with engine.begin() as connection:
+        for table in reversed(RelationalDatabaseBase.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
 @contextmanager
 def demo_rdb() -> Generator[Engine, None, None]:
     """
     Wraps for generating an in-memory DB for running SQL-related tests
     """
-
-    if os.path.exists(".sqlite"):
-        os.remove(".sqlite")
-
-    engine = create_engine(
-        "sqlite:///.sqlite",
-        creator=lambda: connect(
-            "file:.sqlite",
-            uri=True,
-            check_same_thread=False,
-        ),
-    )
-    connection = engine.connect()
-    init_dev_content(connection)
+    engine = demo_rdb_engine()
     try:
         yield engine
     finally:
-        connection.close()
-        os.remove(".sqlite")
+        clear_content(engine)
 
 
 @contextmanager
-def demo_api(*router_name: str) -> Generator[TestClient, None, None]:
+def demo_api() -> Generator[TestClient, None, None]:
     """
-    Environment for testing a router
+    Environment for testing the API
     """
-    api = build_api(*router_name)
+    api = build_api()
     with demo_rdb() as rdb:
 
         async def request_test_rdb():
@@ -92,34 +105,19 @@ def demo_api(*router_name: str) -> Generator[TestClient, None, None]:
 
 
 @contextmanager
-def demo_api_context(
-    *router_name: str,
-) -> Generator[Tuple[TestClient, Engine], None, None]:
+def demo_api_context() -> Generator[Tuple[TestClient, Engine], None, None]:
     """
-    Environment for testing a router
+    Environment for testing the API
     """
-    api = build_api(*router_name)
-    rdb = create_engine(
-        "sqlite:///.sqlite",
-        creator=lambda: connect(
-            "file:.sqlite",
-            uri=True,
-            check_same_thread=False,
-        ),
-    )
-    connection = rdb.connect()
-    init_dev_content(connection)
+    api = build_api()
+    with demo_rdb() as rdb:
 
-    async def request_test_rdb():
-        yield rdb
+        async def request_test_rdb():
+            yield rdb
 
-    async def request_test_graph():
-        yield None
+        async def request_test_graph():
+            yield None
 
-    api.dependency_overrides[request_rdb] = request_test_rdb
-    api.dependency_overrides[request_graph_db] = request_test_graph
-    try:
+        api.dependency_overrides[request_rdb] = request_test_rdb
+        api.dependency_overrides[request_graph_db] = request_test_graph
         yield (TestClient(api), rdb)
-    finally:
-        connection.close()
-        os.remove(".sqlite")
@@ -3,10 +3,12 @@ Validate unit tests
 """
 
 # from fastapi import Depends
+import pytest
 from fastapi.testclient import TestClient
 
 from tds.server.build import build_api
 from tds.settings import settings
+from tests.helpers import demo_api_context, demo_rdb_engine
 
 settings.ES_URL = "http://localhost:9200"
 
@@ -57,3 +59,171 @@ def test_route_collection() -> None:
     assert set(model_route.methods) == set(
         ["POST"]
     ), "/models route should only accept POST method"
+
+
+def test_demo_api_context() -> None:
+    """
+    Ensure the test DB is shared between contexts and emptied after each one
+    """
+    project = {"name": "p", "description": "d", "assets": {}, "active": True}
+
+    with demo_api_context() as (client, rdb):
+        assert rdb is demo_rdb_engine()
+        assert client.post("/projects", json=project).status_code == 201
+        assert len(client.get("/projects").json()) == 1
+
+    with demo_api_context() as (client, rdb):
+        assert rdb is demo_rdb_engine()
+        assert client.get("/projects").json() == []
+
+
+def test_project_put_removes_only_dropped_asset() -> None:
+    """
+    Ensure updating a project deletes only the assets left out of the payload
+    """
+    from sqlalchemy.orm import Session
+
+    from tds.modules.project.model import Project, ProjectAsset
+
+    with demo_api_context() as (client, rdb):
+        with Session(rdb) as session:
+            project = Project(name="p", description="d", active=True)
+            session.add(project)
+            session.flush()
+            project_id = project.id
+            session.add_all(
+                ProjectAsset(
+                    project_id=project_id,
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                )
+                for resource_type, resource_id in [
+                    ("datasets", "11"),
+                    ("datasets", "12"),
+                    ("datasets", "13"),
+                    ("publications", "17"),
+                ]
+            )
+            session.commit()
+            before = {
+                (asset.resource_type, asset.resource_id): asset.id
+                for asset in session.query(ProjectAsset)
+            }
+
+        # Resource ids differ from the row ids, and payload ids are ints while
+        # stored ids are strings.
+        payload = {
+            "id": project_id,
+            "name": "p",
+            "description": "d",
+            "assets": {"datasets": [11, 13], "publications": [17]},
+            "active": True,
+        }
+        response = client.put(f"/projects/{project_id}", json=payload)
+        assert response.status_code == 202
+
+        with Session(rdb) as session:
+            after = {
+                (asset.resource_type, asset.resource_id): asset.id
+                for asset in session.query(ProjectAsset)
+            }
+
+    del before[("datasets", "12")]
+    assert after == before
+
+
+def test_provenance_create_retrieve_delete() -> None:
+    """
+    Ensure a provenance record can be created, fetched and deleted
+    """
+    payload = {
+        "relation_type": "COPIED_FROM",
+        "left": "1",
+        "left_type": "Model",
+        "right": "2",
+        "right_type": "Model",
+    }
+
+    with demo_api_context() as (client, _):
+        response = client.post("/provenance", json=payload)
+        assert response.status_code == 200
+        provenance_id = response.json()["id"]
+
+        response = client.get(f"/provenance/{provenance_id}")
+        assert response.status_code == 200
+        assert response.json()["id"] == provenance_id
+        assert response.json()["relation_type"] == "COPIED_FROM"
+
+        response = client.delete(f"/provenance/{provenance_id}")
+        assert response.status_code == 200
+        assert client.get(f"/provenance/{provenance_id}").status_code == 404
+
+
+@pytest.mark.parametrize(
+    "storage_host, region, bucket, key, token",
+    [
+        ("http://minio:9000", None, "askem", "datasets/1/data.csv", None),
+        (None, "us-east-1", "askem", "datasets/1/data.csv", None),
+        (None, "us-west-2", "askem", "datasets/1/data.csv", None),
+        (None, "us-west-2", "askem.staging", "datasets/1/data.csv", None),
+        (None, "us-east-1", "askem", "datasets/1/a b+c~(1)é.csv", None),
+        (None, "us-west-2", "askem", "datasets/1/data.csv", "to/ken+=="),
+    ],
+)
+def test_presigned_url_matches_boto3(
+    monkeypatch, storage_host, region, bucket, key, token
+) -> None:
+    """
+    Ensure presigned URLs signed directly are identical to boto3's
+    """
+    import datetime
+
+    from tds.lib import s3
+
+    frozen = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+    class FrozenDatetime(datetime.datetime):
+        """
+        Datetime that always returns the same time
+        """
+
+        @classmethod
+        def utcnow(cls):
+            return frozen
+
+        @classmethod
+        def now(cls, tz=None):
+            return frozen.replace(tzinfo=tz)
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIDEXAMPLE")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "wJalrXUtnFEMI/K7MDENG+bPxRfiCY")
+    if token:
+        monkeypatch.setenv("AWS_SESSION_TOKEN", token)
+    else:
+        monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
+    monkeypatch.setattr(settings, "STORAGE_HOST", storage_host)
+    monkeypatch.setattr(settings, "AWS_REGION", region)
+    monkeypatch.setattr(settings, "S3_BUCKET", bucket)
+    monkeypatch.setattr("botocore.auth.datetime.datetime", FrozenDatetime)
+    monkeypatch.setattr(s3, "datetime", FrozenDatetime)
+    for cached in (s3.s3_session, s3.s3_client, s3.presign_endpoint):
+        cached.cache_clear()
+
+    try:
+        for method in s3.PRESIGN_HTTP_METHODS:
+            expected = s3.s3_client().generate_presigned_url(
+                ClientMethod=method,
+                Params={"Bucket": bucket, "Key": key},
+                ExpiresIn=s3.PRESIGNED_URL_EXPIRATION,
+            )
+            path, file_name = key.rsplit("/", 1)
+            assert (
+                s3.get_presigned_url(
+                    entity_id="", file_name=file_name, method=method, path=path
+                )
+                == expected
+            )
+    finally:
+        for cached in (s3.s3_session, s3.s3_client, s3.presign_endpoint):
+            cached.cache_clear()